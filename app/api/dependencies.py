@@ -1,17 +1,18 @@
 """
 FastAPI dependencies
 """
-from functools import lru_cache
 from app.services.token_service import TokenService
 from app.services.agent_service import AgentService
 from app.config.settings import get_settings
 
-@lru_cache()
+# Services are created once at import; the getters below only return them
+_token_service = TokenService()
+_agent_service = AgentService()
+
 def get_token_service() -> TokenService:
     """Get token service instance"""
-    return TokenService()
+    return _token_service
 
-@lru_cache()
 def get_agent_service() -> AgentService:
     """Get agent service instance"""
-    return AgentService()
\ No newline at end of file
+    return _agent_service
\ No newline at end of file
@@ -1,29 +1,30 @@
 """
 Authentication and token management endpoints
 """
-import secrets
+import os
 from typing import Optional
-from fastapi import APIRouter, Query, HTTPException, status, Depends
+from fastapi import APIRouter, Query, HTTPException, Request, status
 import structlog
 
 from app.models.requests import TokenRequest
 from app.models.responses import TokenResponse
-from app.services.token_service import TokenService
 from app.core.exceptions import TokenGenerationError
-from app.api.dependencies import get_token_service
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Bound once for guest identity generation
+_rand = os.urandom
+
 @router.get("/token", response_model=TokenResponse)
 async def get_token(
+    http_request: Request,
     room: str = Query(..., min_length=1, max_length=100, description="Room name"),
     identity: Optional[str] = Query(None, max_length=100, description="User identity"),
     name: Optional[str] = Query(None, max_length=100, description="Display name"),
     ttl_minutes: int = Query(60, ge=1, le=1440, description="Token TTL in minutes"),
     mic_only: bool = Query(True, description="Limit publishing to microphone only"),
-    dispatch_agent: bool = Query(False, description="Whether to dispatch agent on join"),
-    token_service: TokenService = Depends(get_token_service)
+    dispatch_agent: bool = Query(False, description="Whether to dispatch agent on join")
 ):
     """
     Generate a LiveKit access token for joining a room.
@@ -31,11 +32,12 @@ async def get_token(
     This endpoint creates a JWT token that allows a client to join a LiveKit room
     with specified permissions and optional agent dispatch.
     """
+    log = logger.bind(room=room)
     
     try:
         # Generate identity if not provided
         if not identity:
-            identity = f"guest-{secrets.token_urlsafe(8)}"
+            identity = f"guest-{_rand(6).hex()}"
 
         # Create token request
         token_request = TokenRequest(
@@ -48,24 +50,24 @@ async def get_token(
         )
 
         # Generate token
+        token_service = http_request.app.state.token_service
         token_response = await token_service.generate_token(token_request)
         
-        logger.info("Token generated successfully",
-                   room=room,
-                   identity=identity,
-                   ttl_minutes=ttl_minutes,
-                   dispatch_agent=dispatch_agent)
+        log.info("Token generated successfully",
+                 identity=identity,
+                 ttl_minutes=ttl_minutes,
+                 dispatch_agent=dispatch_agent)
         
         return token_response
         
     except TokenGenerationError as e:
-        logger.warning("Token generation validation error", error=str(e))
+        log.warning("Token generation validation error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.exception("Token generation failed")
+        log.exception("Token generation failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate token"
@@ -74,7 +76,7 @@ async def get_token(
 @router.post("/token", response_model=TokenResponse)
 async def create_token(
     request: TokenRequest,
-    token_service: TokenService = Depends(get_token_service)
+    http_request: Request
 ):
     """
     Generate a Room access token using POST request body.
@@ -82,31 +84,32 @@ async def create_token(
     Alternative endpoint that accepts token parameters in the request body
     instead of query parameters.
     """
+    log = logger.bind(room=request.room)
     
     try:
         # Generate identity if not provided
         if not request.identity:
-            request.identity = f"guest-{secrets.token_urlsafe(8)}"
+            request.identity = f"guest-{_rand(6).hex()}"
 
         # Generate token
+        token_service = http_request.app.state.token_service
         token_response = await token_service.generate_token(request)
         
-        logger.info("Token generated successfully",
-                   room=request.room,
-                   identity=request.identity,
-                   ttl_minutes=request.ttl_minutes,
-                   dispatch_agent=request.dispatch_agent)
+        log.info("Token generated successfully",
+                 identity=request.identity,
+                 ttl_minutes=request.ttl_minutes,
+                 dispatch_agent=request.dispatch_agent)
         
         return token_response
         
     except TokenGenerationError as e:
-        logger.warning("Token generation validation error", error=str(e))
+        log.warning("Token generation validation error", error=str(e))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.exception("Token generation failed")
+        log.exception("Token generation failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to generate token"
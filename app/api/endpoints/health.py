@@ -1,17 +1,43 @@
 """
 Health check and monitoring endpoints
 """
+import asyncio
 import datetime as dt
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 import structlog
 
 from app.models.responses import HealthResponse
 from app.config.settings import get_settings
+from app.core.responses import ORJSONResponse
 
 logger = structlog.get_logger()
 router = APIRouter()
 
-@router.get("/health", response_model=HealthResponse)
+_utcnow = dt.datetime.utcnow
+
+# Settings are fixed for the process lifetime, so probes reuse one instance
+_SETTINGS = get_settings()
+
+_HEALTH_RESPONSE_STATIC = {
+    "ws_url": _SETTINGS.livekit_ws_url,
+    "agent_name": _SETTINGS.agent_name,
+    "environment": _SETTINGS.environment.value,
+    "version": "1.0.0",
+}
+
+_LIVE_OK = b'{"status":"alive"}'
+
+# Coarse timestamp for probe responses, refreshed by timestamp_refresher()
+_now_iso = _utcnow().isoformat()
+
+async def timestamp_refresher() -> None:
+    """Refresh the cached probe timestamp once per second"""
+    global _now_iso
+    while True:
+        _now_iso = _utcnow().isoformat()
+        await asyncio.sleep(1)
+
+@router.get("/health", response_class=ORJSONResponse, responses={200: {"model": HealthResponse}})
 async def health_check():
     """
     Health check endpoint for monitoring and load balancing.
@@ -19,18 +45,12 @@ async def health_check():
     Returns the current status of the service including configuration
     and timestamp information.
     """
-    settings = get_settings()
-    
-    return HealthResponse(
-        status="healthy",
-        ws_url=settings.livekit_ws_url,
-        agent_name=settings.agent_name,
-        environment=settings.environment.value,
-        timestamp=dt.datetime.utcnow().isoformat(),
-        version="1.0.0"
-    )
+    # Returned as a response directly so FastAPI skips response model validation.
+    # The token and dispatch routes keep response_model instead: there the
+    # required FastAPI (>=0.130) validates and dumps to JSON in pydantic-core
+    return ORJSONResponse({**_HEALTH_RESPONSE_STATIC, "status": "healthy", "timestamp": _now_iso})
 
-@router.get("/readiness")
+@router.get("/readiness", response_class=ORJSONResponse)
 async def readiness_check():
     """
     Readiness check for Kubernetes deployments.
@@ -38,13 +58,11 @@ async def readiness_check():
     Validates that all required configuration is present
     and the service is ready to accept requests.
     """
-    settings = get_settings()
-    
     # Check required configuration
     required_config = [
-        settings.livekit_ws_url,
-        settings.livekit_api_key,
-        settings.livekit_api_secret
+        _SETTINGS.livekit_ws_url,
+        _SETTINGS.livekit_api_key,
+        _SETTINGS.livekit_api_secret
     ]
     
     if not all(required_config):
@@ -61,4 +79,4 @@ async def liveness_check():
     Simple endpoint to verify the service is still running
     and responding to requests.
     """
-    return {"status": "alive", "timestamp": dt.datetime.utcnow().isoformat()}
\ No newline at end of file
+    return Response(content=_LIVE_OK, media_type="application/json")
\ No newline at end of file
@@ -1,63 +1,98 @@
 """
 Custom middleware for the application
 """
-import time
-import uuid
-from typing import Callable
+import os
+from time import perf_counter as _pc
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from structlog.contextvars import bind_contextvars, clear_contextvars
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.router import API_PREFIX
 
 logger = structlog.get_logger()
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+# Bound once so request ID generation skips the module attribute lookup
+_urandom = os.urandom
+
+# Kubernetes probe endpoints are passed through without request logging
+_PROBE_PATHS = frozenset(API_PREFIX + path for path in ("/health", "/liveness", "/readiness"))
+
+# Security headers pre-encoded for direct extension of the ASGI header list
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"content-security-policy", b"default-src 'self'"),
+)
+
+class LoggingMiddleware:
     """Middleware for logging HTTP requests and responses"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate request ID
-        request_id = str(uuid.uuid4())
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
+        # Servers may include root_path in path, so match probes without it
+        path = scope["path"]
+        root_path = scope.get("root_path")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        if path in _PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Generate request ID
+        request_id = _urandom(16).hex()
+
         # Start timer
-        start_time = time.time()
-        
-        # Log request
-        logger.info("Request started",
-                   request_id=request_id,
-                   method=request.method,
-                   url=str(request.url),
-                   client_ip=request.client.host if request.client else None)
-        
-        # Add request ID to request state
-        request.state.request_id = request_id
-        
+        start_time = _pc()
+
+        # Bind request ID so every log line emitted for this request carries it
+        bind_contextvars(request_id=request_id)
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate duration
+                duration = _pc() - start_time
+
+                # Log request and response as a single record
+                logger.info("Request completed",
+                           method=scope["method"],
+                           path=scope["path"],
+                           status_code=message["status"],
+                           duration_us=int(duration * 1_000_000))
+
+                # Add request ID to response headers
+                message.setdefault("headers", []).append(request_id_header)
+            await send(message)
+
         # Process request
-        response = await call_next(request)
-        
-        # Calculate duration
-        duration = time.time() - start_time
-        
-        # Log response
-        logger.info("Request completed",
-                   request_id=request_id,
-                   status_code=response.status_code,
-                   duration_ms=round(duration * 1000, 2))
-        
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-        
-        return response
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            clear_contextvars()
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Middleware for adding security headers"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
-        
-        return response
\ No newline at end of file
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add security headers
+                message.setdefault("headers", []).extend(_SECURITY_HEADERS)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
\ No newline at end of file
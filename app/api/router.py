@@ -1,12 +1,26 @@
 """
 Main API router that combines all endpoint routers
 """
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.api.endpoints import auth, agent, health
+from app.config.settings import get_settings
+
+# Mount point for api_router; the probe paths in middleware derive from it
+API_PREFIX = "/api/v1"
 
 api_router = APIRouter()
 
+_SETTINGS = get_settings()
+
+# The legacy status body only depends on settings, so serialize it once
+_LEGACY_STATUS_BODY = orjson.dumps({
+    "ws_url": _SETTINGS.livekit_ws_url,
+    "agent_name": _SETTINGS.agent_name,
+    "ok": bool(_SETTINGS.livekit_ws_url and _SETTINGS.agent_name),
+})
+
 # Include all endpoint routers
 api_router.include_router(
     auth.router,
@@ -29,11 +43,4 @@ api_router.include_router(
 @api_router.get("/status", deprecated=True)
 async def legacy_status():
     """Legacy status endpoint - use /health instead"""
-    from app.config.settings import get_settings
-    settings = get_settings()
-    
-    return {
-        "ws_url": settings.livekit_ws_url,
-        "agent_name": settings.agent_name,
-        "ok": bool(settings.livekit_ws_url and settings.agent_name),
-    }
\ No newline at end of file
+    return Response(content=_LEGACY_STATUS_BODY, media_type="application/json")
\ No newline at end of file
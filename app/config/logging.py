@@ -3,41 +3,104 @@ Logging configuration and setup
 """
 import os
 import sys
+import queue
+import datetime as dt
 import logging.config
-from typing import Dict, Any
+import logging.handlers
+from typing import Dict, Any, Optional
 import structlog
 
+# Listener thread that formats and writes records queued by request handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_listener_running = False
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The default implementation formats the record here, which would
+        # render structlog's event dict on the calling (event loop) thread
+        return record
+
+def _add_record_timestamp(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Stamp foreign records with their creation time, not the listener's write time"""
+    record = event_dict.get("_record")
+    if record is not None:
+        created = dt.datetime.fromtimestamp(record.created, dt.timezone.utc)
+        event_dict["timestamp"] = created.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return event_dict
+
 def setup_logging(log_level: str = "INFO") -> None:
     """
     Setup structured logging configuration
-    
+
+    Log calls only enqueue the record; rendering and stream I/O happen on a
+    background listener started by start_log_listener().
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    
+    global _queue_listener
+
     # Configure structlog
     structlog.configure(
         processors=[
+            # Must run on the calling thread, where the request's context lives
+            structlog.contextvars.merge_contextvars,
             structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
+            # Needs the caller's sys.exc_info(), so it cannot be deferred
             structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer() if os.getenv("ENVIRONMENT") == "production" 
-            else structlog.dev.ConsoleRenderer()
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
-    
+
+    # Final rendering runs on the listener thread
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer() if os.getenv("ENVIRONMENT") == "production"
+            else structlog.dev.ConsoleRenderer()
+        ],
+        # Plain stdlib records only reach structlog here, on the listener thread
+        foreign_pre_chain=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            _add_record_timestamp,
+            structlog.processors.format_exc_info,
+        ],
+    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    stop_log_listener()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
     # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
\ No newline at end of file
+    root_logger = logging.getLogger()
+    root_logger.handlers = [_PassthroughQueueHandler(log_queue)]
+    root_logger.setLevel(getattr(logging, log_level.upper()))
+
+def start_log_listener() -> None:
+    """Start writing queued log records in the background"""
+    global _listener_running
+    if _queue_listener is not None and not _listener_running:
+        _queue_listener.start()
+        _listener_running = True
+
+def stop_log_listener() -> None:
+    """Flush queued log records and stop the background listener"""
+    global _listener_running
+    if _queue_listener is not None and _listener_running:
+        _queue_listener.stop()
+        _listener_running = False
\ No newline at end of file
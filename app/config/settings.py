@@ -1,11 +1,12 @@
 """
 Application configuration and settings - Fixed for Pydantic V2
 """
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Annotated, List, Optional
+import orjson
 from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 class Environment(str, Enum):
     """Environment types"""
@@ -33,6 +34,7 @@ class SecuritySettings(BaseModel):
 class CacheSettings(BaseModel):
     """Cache configuration"""
     dispatch_cache_ttl_seconds: int = Field(default=3, description="Dispatch cache TTL")
+    token_cache_ttl_seconds: int = Field(default=30, description="Issued token cache TTL")
     max_room_name_length: int = Field(default=100, description="Maximum room name length")
     max_identity_length: int = Field(default=100, description="Maximum identity length")
 
@@ -46,6 +48,9 @@ class Settings(BaseSettings):
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
+    # Dispatch and token caches are per process, so extra workers weaken
+    # duplicate dispatch suppression
+    workers: int = Field(default=1, ge=1)
     
     # LiveKit configuration
     livekit_ws_url: str = Field(..., description="LiveKit WebSocket URL")
@@ -56,19 +61,20 @@ class Settings(BaseSettings):
     # Agent configuration
     agent_name: str = Field(default="py-agent", description="Default agent name")
     
-    # Security settings - Accept Union to handle both string and list
-    trusted_hosts: Union[str, List[str]] = Field(default=["*"])
+    # Security settings
+    trusted_hosts: Annotated[List[str], NoDecode] = Field(default=["*"])
     max_token_ttl_minutes: int = Field(default=1440, ge=1, le=10080)  # Max 1 week
     default_token_ttl_minutes: int = Field(default=60, ge=1, le=1440)
     
-    # CORS settings - Accept Union to handle both string and list
-    cors_allow_origins: Union[str, List[str]] = Field(default=["*"])
+    # CORS settings
+    cors_allow_origins: Annotated[List[str], NoDecode] = Field(default=["*"])
     cors_allow_credentials: bool = True
     cors_allow_methods: List[str] = Field(default=["*"])
     cors_allow_headers: List[str] = Field(default=["*"])
     
     # Cache settings
     dispatch_cache_ttl_seconds: int = Field(default=3, ge=1, le=60)
+    token_cache_ttl_seconds: int = Field(default=30, ge=1, le=60)
     max_room_name_length: int = Field(default=100, ge=1, le=255)
     max_identity_length: int = Field(default=100, ge=1, le=255)
     
@@ -79,14 +85,22 @@ class Settings(BaseSettings):
         extra="ignore"  # Ignore extra environment variables
     )
 
+    # Both fields are NoDecode, so raw env strings reach this validator instead
+    # of pydantic-settings' JSON decoding; it accepts JSON lists and comma lists
     @field_validator('cors_allow_origins', 'trusted_hosts', mode='before')
     @classmethod
     def parse_list_from_string(cls, v):
-        """Parse comma-separated strings into lists, handle special case of '*'"""
+        """Parse JSON lists or comma-separated strings into lists, handle special case of '*'"""
         if isinstance(v, str):
             # Handle the special case of "*"
             if v.strip() == "*":
                 return ["*"]
+            # NoDecode skips pydantic-settings' JSON parsing, so handle JSON lists here
+            if v.lstrip().startswith("["):
+                try:
+                    return orjson.loads(v)
+                except orjson.JSONDecodeError:
+                    pass
             # Handle comma-separated values
             return [item.strip() for item in v.split(',') if item.strip()]
         # If it's already a list, return as-is
@@ -100,19 +114,7 @@ class Settings(BaseSettings):
             raise ValueError("Invalid URL format")
         return v
 
-    def get_trusted_hosts_list(self) -> List[str]:
-        """Get trusted hosts as a list"""
-        if isinstance(self.trusted_hosts, str):
-            return [self.trusted_hosts]
-        return self.trusted_hosts
-
-    def get_cors_origins_list(self) -> List[str]:
-        """Get CORS origins as a list"""
-        if isinstance(self.cors_allow_origins, str):
-            return [self.cors_allow_origins]
-        return self.cors_allow_origins
-
-    @property
+    @cached_property
     def livekit_config(self) -> LiveKitSettings:
         """Get LiveKit configuration"""
         return LiveKitSettings(
@@ -122,24 +124,25 @@ class Settings(BaseSettings):
             api_secret=self.livekit_api_secret
         )
 
-    @property
+    @cached_property
     def security_config(self) -> SecuritySettings:
         """Get security configuration"""
         return SecuritySettings(
-            trusted_hosts=self.get_trusted_hosts_list(),
+            trusted_hosts=self.trusted_hosts,
             max_token_ttl_minutes=self.max_token_ttl_minutes,
             default_token_ttl_minutes=self.default_token_ttl_minutes,
-            cors_allow_origins=self.get_cors_origins_list(),
+            cors_allow_origins=self.cors_allow_origins,
             cors_allow_credentials=self.cors_allow_credentials,
             cors_allow_methods=self.cors_allow_methods,
             cors_allow_headers=self.cors_allow_headers,
         )
 
-    @property
+    @cached_property
     def cache_config(self) -> CacheSettings:
         """Get cache configuration"""
         return CacheSettings(
             dispatch_cache_ttl_seconds=self.dispatch_cache_ttl_seconds,
+            token_cache_ttl_seconds=self.token_cache_ttl_seconds,
             max_room_name_length=self.max_room_name_length,
             max_identity_length=self.max_identity_length,
         )
@@ -5,8 +5,8 @@ try:
     print("✅ Settings loaded successfully!")
     print(f"Environment: {settings.environment}")
     print(f"LiveKit WS URL: {settings.livekit_ws_url}")
-    print(f"Trusted hosts: {settings.get_trusted_hosts_list()}")
-    print(f"CORS origins: {settings.get_cors_origins_list()}")
+    print(f"Trusted hosts: {settings.trusted_hosts}")
+    print(f"CORS origins: {settings.cors_allow_origins}")
 except Exception as e:
     print(f"❌ Error: {e}")
     import traceback
@@ -0,0 +1,136 @@
+"""
+Sharded in-memory TTL cache shared by the services
+"""
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Hashable, List, Optional, Tuple
+
+class _CacheShard:
+    """One independently locked slice of a sharded cache"""
+    
+    __slots__ = ("lock", "entries", "ops_since_sweep")
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Maps key -> (inserted_ns, value); the oldest or least recently used entry is first
+        self.entries: "OrderedDict[Hashable, Tuple[int, Any]]" = OrderedDict()
+        self.ops_since_sweep = 0
+
+class ShardedTTLCache:
+    """Thread-safe TTL cache split across independently locked shards"""
+    
+    # Kept in plain Python: the OrderedDict and lock calls already run in C,
+    # and cachetools.TTLCache is itself pure Python, so it offers no native path
+    
+    def __init__(
+        self,
+        ttl_seconds: int,
+        sweep_interval: int = 256,
+        max_size: int = 10_000,
+        shard_count: int = 16,
+        move_to_end_on_hit: bool = False
+    ):
+        if shard_count < 1 or shard_count & (shard_count - 1):
+            raise ValueError("shard_count must be a power of two")
+        self.ttl_seconds = ttl_seconds
+        # Monotonic integer nanoseconds: immune to wall-clock jumps, no float math
+        self._ttl_ns = ttl_seconds * 1_000_000_000
+        self.sweep_interval = sweep_interval
+        self.max_size = max_size
+        # LRU when set; otherwise entries stay in insertion-time order
+        self.move_to_end_on_hit = move_to_end_on_hit
+        # Each key lives in one shard, so different keys rarely contend for a lock
+        self._shards: List[_CacheShard] = [_CacheShard() for _ in range(shard_count)]
+        self._shard_mask = shard_count - 1
+        self._shard_max_size = max(1, max_size // shard_count)
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value cached for key, if it has not expired"""
+        now = time.monotonic_ns()
+        shard = self._shards[hash(key) & self._shard_mask]
+        
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None or now - entry[0] >= self._ttl_ns:
+                return None
+            if self.move_to_end_on_hit:
+                shard.entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value for key, replacing any previous entry"""
+        now = time.monotonic_ns()
+        shard = self._shards[hash(key) & self._shard_mask]
+        
+        with shard.lock:
+            shard.entries[key] = (now, value)
+            shard.entries.move_to_end(key)
+            self._after_insert(shard, now)
+    
+    def add(self, key: Hashable, value: Any = None) -> bool:
+        """Store value unless key has a live entry; return whether it was stored"""
+        now = time.monotonic_ns()
+        shard = self._shards[hash(key) & self._shard_mask]
+        
+        with shard.lock:
+            entries = shard.entries
+            
+            # Single lookup covers both the hit check and the re-insert case
+            entry = entries.get(key)
+            if entry is not None and now - entry[0] < self._ttl_ns:
+                if self.move_to_end_on_hit:
+                    entries.move_to_end(key)
+                return False
+            
+            # A new key is already appended at the end, so only a refresh
+            # after expiry needs moving
+            entries[key] = (now, value)
+            if entry is not None:
+                entries.move_to_end(key)
+            self._after_insert(shard, now)
+            return True
+    
+    def _after_insert(self, shard: _CacheShard, now: int) -> None:
+        """Enforce the size cap and periodic sweep; caller holds the shard lock"""
+        # Cap memory by evicting the oldest (or least recently used) entry
+        if len(shard.entries) > self._shard_max_size:
+            shard.entries.popitem(last=False)
+        
+        # Expired entries are only swept every few inserts, not on every call
+        shard.ops_since_sweep += 1
+        if shard.ops_since_sweep >= self.sweep_interval:
+            self._sweep(shard, now)
+    
+    def _sweep(self, shard: _CacheShard, now: int) -> None:
+        """Drop expired entries from a shard; caller holds its lock"""
+        entries = shard.entries
+        ttl_ns = self._ttl_ns
+        
+        if self.move_to_end_on_hit:
+            # Hits reorder entries, so expired ones can sit behind a live head;
+            # scan the whole shard, which the per-shard cap keeps bounded
+            expired = [key for key, (inserted, _) in entries.items() if now - inserted >= ttl_ns]
+            if len(expired) * 2 > len(entries):
+                shard.entries = OrderedDict(
+                    (key, entry) for key, entry in entries.items() if now - entry[0] < ttl_ns
+                )
+            else:
+                for key in expired:
+                    del entries[key]
+        else:
+            # Entries are in timestamp order, so the expired ones form a prefix
+            expired_count = 0
+            for inserted, _ in entries.values():
+                if now - inserted < ttl_ns:
+                    break
+                expired_count += 1
+            
+            if expired_count * 2 > len(entries):
+                # Mostly expired: copying the live tail beats popping each entry
+                shard.entries = OrderedDict(islice(entries.items(), expired_count, None))
+            else:
+                for _ in range(expired_count):
+                    entries.popitem(last=False)
+        shard.ops_since_sweep = 0
\ No newline at end of file
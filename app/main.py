@@ -1,17 +1,20 @@
 """
 FastAPI application factory and configuration
 """
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.config.settings import get_settings
-from app.config.logging import setup_logging
-from app.api.router import api_router
+from app.config.logging import setup_logging, start_log_listener, stop_log_listener
+from app.api.router import API_PREFIX, api_router
+from app.api.endpoints.health import timestamp_refresher
 from app.api.middleware import LoggingMiddleware, SecurityHeadersMiddleware
+from app.api.dependencies import get_token_service, get_agent_service
 from app.core.exceptions import APIException
+from app.core.responses import ORJSONResponse
 from app.models.responses import ErrorResponse
 import structlog
 
@@ -24,29 +27,50 @@ async def lifespan(app: FastAPI):
     """Application lifespan management"""
     settings = get_settings()
     
-    # Startup
-    logger.info("Starting LESA API server", 
-               environment=settings.environment,
-               debug=settings.debug)
+    # Begin writing queued log records (including any emitted at import)
+    start_log_listener()
     
-    # Validate required settings
-    if not all([
-        settings.livekit_ws_url,
-        settings.livekit_api_key,
-        settings.livekit_api_secret
-    ]):
-        logger.error("Missing required application configuration")
-        raise RuntimeError("Missing required application configuration")
-    
-    yield
-    
-    # Shutdown
-    logger.info("Shutting down LESA API server")
+    try:
+        # Startup
+        logger.info("Starting LESA API server", 
+                   environment=settings.environment,
+                   debug=settings.debug)
+        
+        # Validate required settings
+        if not all([
+            settings.livekit_ws_url,
+            settings.livekit_api_key,
+            settings.livekit_api_secret
+        ]):
+            logger.error("Missing required application configuration")
+            raise RuntimeError("Missing required application configuration")
+        
+        # Expose services on app state so hot endpoints skip dependency resolution
+        app.state.token_service = get_token_service()
+        app.state.agent_service = get_agent_service()
+        
+        # Keep the health check timestamp current without per-request formatting
+        timestamp_task = asyncio.create_task(timestamp_refresher())
+        
+        yield
+        
+        # Shutdown
+        logger.info("Shutting down LESA API server")
+        timestamp_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await timestamp_task
+        await app.state.agent_service.aclose()
+    finally:
+        # Flush anything still queued before the process exits
+        stop_log_listener()
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
     settings = get_settings()
     
+    # No default_response_class: from FastAPI 0.130 (the required floor),
+    # response_model routes are dumped straight to JSON bytes by pydantic-core,
+    # and any custom default response class would turn that path off
     app = FastAPI(
         title="LESA Token & Dispatch API",
         description="API for LESA token generation and agent dispatch",
@@ -63,32 +87,34 @@ def create_app() -> FastAPI:
     setup_exception_handlers(app)
     
     # Include API routes
-    app.include_router(api_router, prefix="/api/v1")
+    app.include_router(api_router, prefix=API_PREFIX)
     
     return app
 
 def setup_middleware(app: FastAPI, settings):
     """Setup application middleware"""
     
-    # Security headers middleware (first)
-    app.add_middleware(SecurityHeadersMiddleware)
-    
-    # Request logging middleware
-    app.add_middleware(LoggingMiddleware)
-    
-    # Trusted host middleware - use the new method
-    trusted_hosts = settings.get_trusted_hosts_list()
-    if trusted_hosts != ["*"]:
-        app.add_middleware(TrustedHostMiddleware, allowed_hosts=trusted_hosts)
+    # Trusted host middleware
+    if settings.trusted_hosts != ["*"]:
+        app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.trusted_hosts)
     
-    # CORS middleware (last) - use the new method
+    # CORS middleware (last)
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.get_cors_origins_list(),
+        allow_origins=settings.cors_allow_origins,
         allow_credentials=settings.cors_allow_credentials,
         allow_methods=settings.cors_allow_methods,
         allow_headers=settings.cors_allow_headers,
     )
+    
+    # Request logging and security headers wrap the whole stack, outside
+    # Starlette's ServerErrorMiddleware, so error responses get them too
+    build_middleware_stack = app.build_middleware_stack
+    
+    def build_outer_middleware_stack():
+        return LoggingMiddleware(SecurityHeadersMiddleware(build_middleware_stack()))
+    
+    app.build_middleware_stack = build_outer_middleware_stack
 
 def setup_exception_handlers(app: FastAPI):
     """Setup global exception handlers"""
@@ -101,7 +127,7 @@ def setup_exception_handlers(app: FastAPI):
                     detail=exc.detail,
                     path=request.url.path)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=ErrorResponse.from_exception(exc).dict()
         )
@@ -112,7 +138,7 @@ def setup_exception_handlers(app: FastAPI):
         logger.exception("Unexpected error occurred", path=request.url.path)
         
         settings = get_settings()
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content=ErrorResponse(
                 error="Internal Server Error",
@@ -124,6 +150,7 @@ def setup_exception_handlers(app: FastAPI):
 app = create_app()
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     from app.config.settings import get_settings
     
@@ -132,7 +159,15 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.host,
         port=settings.port,
+        # uvloop is not available on Windows
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        # Reload mode runs a single process. Duplicate dispatch suppression and
+        # the token cache live in each worker's memory, so identical requests
+        # reaching different workers are not deduplicated
+        workers=1 if settings.debug else settings.workers,
         log_level="info",
         reload=settings.debug,
-        access_log=True,
+        # LoggingMiddleware already records every request
+        access_log=False,
     )
\ No newline at end of file
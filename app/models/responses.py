@@ -5,6 +5,8 @@ import datetime as dt
 from typing import Optional
 from pydantic import BaseModel, Field
 
+_utcnow = dt.datetime.utcnow
+
 class TokenResponse(BaseModel):
     """Token response model"""
     token: str = Field(..., description="JWT access token")
@@ -34,7 +36,7 @@ class ErrorResponse(BaseModel):
     """Error response model"""
     error: str = Field(..., description="Error type")
     detail: str = Field(..., description="Error details")
-    timestamp: str = Field(default_factory=lambda: dt.datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=lambda: _utcnow().isoformat())
     error_code: Optional[str] = Field(None, description="Specific error code")
     request_id: Optional[str] = Field(None, description="Request correlation ID")
 
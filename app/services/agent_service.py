@@ -1,8 +1,9 @@
 """
 Agent dispatch service
 """
-import time
-from typing import Dict, Tuple
+import asyncio
+import hashlib
+from typing import Dict, Optional, Tuple
 import structlog
 
 from livekit.api import LiveKitAPI, CreateAgentDispatchRequest
@@ -10,35 +11,41 @@ from livekit.api import LiveKitAPI, CreateAgentDispatchRequest
 from app.config.settings import get_settings
 from app.models.requests import DispatchRequest
 from app.models.responses import DispatchResponse
+from app.core.cache import ShardedTTLCache
 from app.core.exceptions import AgentDispatchError
 
 logger = structlog.get_logger()
 
-class DispatchCache:
+# Metadata sent when a dispatch carries none
+_EMPTY_META = "{}"
+
+def _dispatch_key(room: str, agent: str) -> int:
+    """Compact 64-bit cache key for a (room, agent) pair"""
+    # Room and agent names are not restricted to any character set, so the
+    # room is length-prefixed rather than separated: no two pairs share bytes
+    room_bytes = room.encode()
+    digest = hashlib.blake2b(
+        len(room_bytes).to_bytes(4, "little") + room_bytes + agent.encode(),
+        digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+class DispatchCache(ShardedTTLCache):
     """Thread-safe dispatch cache to prevent duplicates"""
     
-    def __init__(self, ttl_seconds: int = 3):
-        self.ttl_seconds = ttl_seconds
-        self._cache: Dict[Tuple[str, str], float] = {}
+    def __init__(
+        self,
+        ttl_seconds: int = 3,
+        sweep_interval: int = 256,
+        max_size: int = 10_000,
+        shard_count: int = 16
+    ):
+        super().__init__(ttl_seconds, sweep_interval, max_size, shard_count)
     
     def should_skip(self, room: str, agent: str) -> bool:
         """Check if dispatch should be skipped due to recent duplicate"""
-        now = time.time()
-        key = (room, agent)
-        
-        # Clean expired entries
-        expired_keys = [k for k, timestamp in self._cache.items() 
-                       if now - timestamp > self.ttl_seconds]
-        for k in expired_keys:
-            self._cache.pop(k, None)
-        
-        # Check if recent dispatch exists
-        if key in self._cache and (now - self._cache[key]) < self.ttl_seconds:
-            return True
-        
-        # Record this dispatch
-        self._cache[key] = now
-        return False
+        # Records the dispatch when there is no recent duplicate
+        return not self.add(_dispatch_key(room, agent))
 
 class AgentService:
     """Service for managing LiveKit agent dispatches"""
@@ -46,6 +53,28 @@ class AgentService:
     def __init__(self):
         self.settings = get_settings()
         self.dispatch_cache = DispatchCache(self.settings.dispatch_cache_ttl_seconds)
+        self._lk_api: Optional[LiveKitAPI] = None
+        # Dispatches currently awaiting LiveKit, keyed by (room, agent)
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[DispatchResponse]"] = {}
+    
+    def _get_api(self) -> LiveKitAPI:
+        """Get the shared LiveKit API client, creating it on first use"""
+        # Created lazily because the client's HTTP session needs a running
+        # event loop; there is no await between the check and the assignment,
+        # so concurrent callers cannot create two clients
+        if self._lk_api is None:
+            self._lk_api = LiveKitAPI(
+                url=self.settings.livekit_url,
+                api_key=self.settings.livekit_api_key,
+                api_secret=self.settings.livekit_api_secret
+            )
+        return self._lk_api
+    
+    async def aclose(self) -> None:
+        """Close the shared LiveKit API client"""
+        if self._lk_api is not None:
+            lk_api, self._lk_api = self._lk_api, None
+            await lk_api.aclose()
     
     async def create_dispatch(self, request: DispatchRequest) -> DispatchResponse:
         """
@@ -62,37 +91,68 @@ class AgentService:
         """
         
         try:
+            room = request.room
             agent_name = request.agent_name or self.settings.agent_name
+            key = (room, agent_name)
+            
+            # Concurrent identical requests share the in-flight dispatch result.
+            # asyncio.wait neither cancels the shared future when a waiter is
+            # cancelled nor re-raises its exception instance in this task
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                logger.info("Joining in-flight dispatch",
+                           room=room,
+                           agent=agent_name)
+                await asyncio.wait((inflight,))
+                exc = inflight.exception()
+                if exc is not None:
+                    # A fresh error per waiter keeps each traceback to its own task
+                    if isinstance(exc, AgentDispatchError):
+                        raise AgentDispatchError(str(exc)) from exc
+                    raise AgentDispatchError(f"Failed to create agent dispatch: {str(exc)}") from exc
+                return inflight.result()
             
             # Check for duplicate dispatch
-            if self.dispatch_cache.should_skip(request.room, agent_name):
+            if self.dispatch_cache.should_skip(room, agent_name):
                 logger.info("Skipping duplicate dispatch",
-                           room=request.room,
+                           room=room,
                            agent=agent_name)
                 return DispatchResponse(
                     dispatch_id="skipped",
-                    room=request.room,
+                    room=room,
                     agent_name=agent_name,
                     note="duplicate-suppressed"
                 )
             
-            # Create dispatch
-            dispatch_id = await self._create_livekit_dispatch(
-                room=request.room,
-                agent_name=agent_name,
-                metadata=request.metadata
-            )
-            
-            logger.info("Agent dispatch created successfully",
-                       dispatch_id=dispatch_id,
-                       room=request.room,
-                       agent=agent_name)
-            
-            return DispatchResponse(
-                dispatch_id=dispatch_id,
-                room=request.room,
-                agent_name=agent_name
-            )
+            # Create dispatch. Calls are not batched: LiveKit has no bulk
+            # dispatch endpoint, so a batch would still be one HTTP request per
+            # dispatch, and duplicates are already suppressed by the cache
+            # check above before anything is awaited
+            future: "asyncio.Future[DispatchResponse]" = asyncio.get_running_loop().create_future()
+            self._inflight[key] = future
+            try:
+                dispatch_id = await self._create_livekit_dispatch(
+                    room=room,
+                    agent_name=agent_name,
+                    metadata=request.metadata
+                )
+                response = DispatchResponse(
+                    dispatch_id=dispatch_id,
+                    room=room,
+                    agent_name=agent_name
+                )
+                future.set_result(response)
+                return response
+            except BaseException as e:
+                # Waiters must not inherit the first caller's cancellation
+                if isinstance(e, asyncio.CancelledError):
+                    e = AgentDispatchError("In-flight dispatch was cancelled")
+                future.set_exception(e)
+                # Mark retrieved so asyncio does not warn when nobody was waiting
+                future.exception()
+                raise
+            finally:
+                del self._inflight[key]
             
         except Exception as e:
             logger.exception("Agent dispatch failed")
@@ -103,11 +163,12 @@ class AgentService:
     async def _create_livekit_dispatch(self, room: str, agent_name: str, metadata: str) -> str:
         """Create LiveKit agent dispatch"""
         
-        async with LiveKitAPI() as lk_api:
-            request = CreateAgentDispatchRequest(
-                agent_name=agent_name,
-                room=room,
-                metadata=metadata or "{}",
-            )
-            dispatch = await lk_api.agent_dispatch.create_dispatch(request)
-            return dispatch.dispatch_id
\ No newline at end of file
+        # Reuse one client so dispatches share its keep-alive connection pool
+        lk_api = self._get_api()
+        request = CreateAgentDispatchRequest(
+            agent_name=agent_name,
+            room=room,
+            metadata=metadata or _EMPTY_META,
+        )
+        dispatch = await lk_api.agent_dispatch.create_dispatch(request)
+        return dispatch.dispatch_id
\ No newline at end of file
@@ -2,7 +2,10 @@
 Token generation service - Fixed to pass credentials explicitly
 """
 import datetime as dt
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import NoReturn, Optional, Tuple
+import orjson
 import structlog
 
 from livekit.api import AccessToken, VideoGrants, RoomConfiguration, RoomAgentDispatch
@@ -10,15 +13,42 @@ from livekit.api import AccessToken, VideoGrants, RoomConfiguration, RoomAgentDi
 from app.config.settings import get_settings
 from app.models.requests import TokenRequest
 from app.models.responses import TokenResponse
+from app.core.cache import ShardedTTLCache
 from app.core.exceptions import TokenGenerationError
 
 logger = structlog.get_logger()
 
+# Shared by every mic-only grant; passed to the constructor rather than copying
+# a prototype grant, which measured slower than building a fresh VideoGrants
+_MIC_ONLY_SOURCES = ["microphone"]
+
+# Tokens are only reused when their lifetime is at least this many cache
+# buckets, so a cached token always has most of its lifetime left
+_MIN_CACHEABLE_BUCKETS = 10
+
+@lru_cache(maxsize=2)
+def _ts_for(sec: int) -> Tuple[dt.datetime, str]:
+    """UTC datetime and its ISO string for a whole epoch second"""
+    # Tokens issued within the same second share one datetime and string
+    now = dt.datetime.utcfromtimestamp(sec)
+    return now, now.isoformat()
+
 class TokenService:
     """Service for generating LiveKit access tokens"""
     
     def __init__(self):
         self.settings = get_settings()
+        # Agent metadata only varies by timestamp, so the rest is encoded once;
+        # the closing brace is dropped so the timestamp can be appended last
+        self._meta_prefix = orjson.dumps({
+            "source": "api",
+            "environment": self.settings.environment,
+        }).decode()[:-1] + ',"timestamp":"'
+        # Issued tokens, least recently used first
+        self.token_cache = ShardedTTLCache(
+            self.settings.token_cache_ttl_seconds,
+            move_to_end_on_hit=True
+        )
     
     async def generate_token(self, request: TokenRequest) -> TokenResponse:
         """
@@ -34,73 +64,115 @@ class TokenService:
             TokenGenerationError: If token generation fails
         """
         
+        # Single validation gate for every caller
+        await self.validate_token_request(request)
+        
         try:
-            # Validate TTL
-            if request.ttl_minutes > self.settings.max_token_ttl_minutes:
-                raise TokenGenerationError(
-                    f"TTL exceeds maximum allowed: {self.settings.max_token_ttl_minutes} minutes"
-                )
+            # Hot path: settings and request fields are read into locals once
+            s = self.settings
+            token_cache = self.token_cache
+            room = request.room
+            identity = request.identity
+            ttl_minutes = request.ttl_minutes
             
-            # Create video grants
-            grants = VideoGrants(
-                room_join=True,
-                room=request.room,
-                can_publish=True,
-                can_subscribe=True
-            )
+            # Repeat requests within the same time bucket reuse the signed token
+            now_sec = int(time.time())
+            bucket = token_cache.ttl_seconds
+            ttl_seconds = ttl_minutes * 60
+            cacheable = ttl_seconds >= _MIN_CACHEABLE_BUCKETS * bucket
+            if cacheable:
+                cache_key = (
+                    identity,
+                    request.name,
+                    room,
+                    request.mic_only,
+                    request.dispatch_agent,
+                    ttl_minutes,
+                    now_sec // bucket,
+                )
+                cached = token_cache.get(cache_key)
+                # Never hand out a token that has lost more than one bucket of
+                # its lifetime, even if the wall clock jumped since it was cached
+                if cached is not None and (
+                    (cached.expires_at - _ts_for(now_sec)[0]).total_seconds()
+                    >= ttl_seconds - bucket
+                ):
+                    return cached
             
-            # Restrict publishing sources if mic_only is enabled
+            # Create video grants, restricting publishing sources if mic_only is enabled
             if request.mic_only:
-                grants.can_publish_sources = ["microphone"]
+                grants = VideoGrants(
+                    room_join=True,
+                    room=room,
+                    can_publish=True,
+                    can_subscribe=True,
+                    can_publish_sources=_MIC_ONLY_SOURCES
+                )
+            else:
+                grants = VideoGrants(
+                    room_join=True,
+                    room=room,
+                    can_publish=True,
+                    can_subscribe=True
+                )
 
             # Build access token - PASS CREDENTIALS EXPLICITLY
+            # The fluent setters only assign attributes and return self, so the
+            # chain is cheaper than copying a prebuilt template, which would
+            # also need a fresh Claims since copies share the template's
+            ttl = dt.timedelta(minutes=ttl_minutes)
             token_builder = (
                 AccessToken(
-                    api_key=self.settings.livekit_api_key,
-                    api_secret=self.settings.livekit_api_secret
+                    api_key=s.livekit_api_key,
+                    api_secret=s.livekit_api_secret
                 )
-                .with_identity(request.identity)
-                .with_name(request.name or request.identity)
+                .with_identity(identity)
+                .with_name(request.name or identity)
                 .with_grants(grants)
-                .with_ttl(dt.timedelta(minutes=request.ttl_minutes))
+                .with_ttl(ttl)
             )
 
             # Add room configuration with agent dispatch if requested
             if request.dispatch_agent:
                 room_config = RoomConfiguration(
                     agents=[RoomAgentDispatch(
-                        agent_name=self.settings.agent_name,
+                        agent_name=s.agent_name,
                         metadata=self._build_agent_metadata()
                     )]
                 )
                 token_builder = token_builder.with_room_config(room_config)
 
-            # Generate JWT token
+            # Generate JWT token. Signed inline: PyJWT's claim encoding holds
+            # the GIL and HMAC over a short payload does not release it, so a
+            # thread hop adds more latency than it frees on the event loop.
+            # HS256 already runs through hashlib's OpenSSL SHA-256, so most of
+            # the cost is PyJWT encoding the claims, not the HMAC itself
             jwt_token = token_builder.to_jwt()
             
-            logger.info("Token generated",
-                       room=request.room,
-                       identity=request.identity,
-                       ttl_minutes=request.ttl_minutes)
-            
-            return TokenResponse(
+            token_response = TokenResponse(
                 token=jwt_token,
-                ws_url=self.settings.livekit_ws_url,
-                room=request.room,
-                identity=request.identity,
-                ttl_minutes=request.ttl_minutes,
-                expires_at=dt.datetime.utcnow() + dt.timedelta(minutes=request.ttl_minutes)
+                ws_url=s.livekit_ws_url,
+                room=room,
+                identity=identity,
+                ttl_minutes=ttl_minutes,
+                expires_at=_ts_for(now_sec)[0] + ttl
             )
+            if cacheable:
+                token_cache.put(cache_key, token_response)
+            return token_response
             
         except Exception as e:
-            logger.exception("Token generation failed", request=request.dict())
+            logger.exception("Token generation failed",
+                            room=request.room,
+                            identity=request.identity,
+                            ttl_minutes=request.ttl_minutes)
             if isinstance(e, TokenGenerationError):
                 raise
             raise TokenGenerationError(f"Failed to generate token: {str(e)}")
     
     def _build_agent_metadata(self) -> str:
         """Build metadata for agent dispatch"""
-        return f'{{"source":"api","timestamp":"{dt.datetime.utcnow().isoformat()}","environment":"{self.settings.environment}"}}'
+        return self._meta_prefix + _ts_for(int(time.time()))[1] + '"}'
     
     async def validate_token_request(self, request: TokenRequest) -> None:
         """
@@ -113,6 +185,19 @@ class TokenService:
             TokenGenerationError: If validation fails
         """
         
+        # Single combined check; which bound failed is only worked out on error
+        s = self.settings
+        identity = request.identity
+        if not (
+            len(request.room) <= s.max_room_name_length
+            and (not identity or len(identity) <= s.max_identity_length)
+            and 1 <= request.ttl_minutes <= s.max_token_ttl_minutes
+        ):
+            self._raise_validation(request)
+    
+    def _raise_validation(self, request: TokenRequest) -> NoReturn:
+        """Raise the error for the first bound a request exceeds"""
+        
         # Room name validation
         if len(request.room) > self.settings.max_room_name_length:
             raise TokenGenerationError(
@@ -129,7 +214,6 @@ class TokenService:
         if request.ttl_minutes < 1:
             raise TokenGenerationError("TTL must be at least 1 minute")
         
-        if request.ttl_minutes > self.settings.max_token_ttl_minutes:
-            raise TokenGenerationError(
-                f"TTL exceeds maximum allowed: {self.settings.max_token_ttl_minutes} minutes"
-            )
\ No newline at end of file
+        raise TokenGenerationError(
+            f"TTL exceeds maximum allowed: {self.settings.max_token_ttl_minutes} minutes"
+        )
\ No newline at end of file